@@ -4,6 +4,6 @@ __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from modern_python_template.core import greet, process_data
+from modern_python_template.core import greet, greet_many, process_data
 
-__all__ = ["greet", "process_data"]
+__all__ = ["greet", "greet_many", "process_data"]
@@ -3,7 +3,9 @@
 import json
 import logging
 import sys
+from itertools import islice
 from pathlib import Path
+from typing import TextIO
 
 import click
 from rich.console import Console
@@ -13,11 +15,14 @@ from modern_python_template.core import (
     calculate_statistics,
     display_data,
     greet,
+    greet_many,
     process_data,
 )
 
 console = Console()
 
+GREETING_CHUNK_SIZE = 8192
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Setup logging configuration."""
@@ -26,7 +31,7 @@ def setup_logging(verbose: bool = False) -> None:
         level=level,
         format="%(message)s",
         datefmt="[%X]",
-        handlers=[RichHandler(rich_tracebacks=True)],
+        handlers=[RichHandler(console=Console(stderr=True), rich_tracebacks=True)],
     )
 
 
@@ -44,13 +49,35 @@ def cli(verbose: bool) -> None:
 
 
 @cli.command()
-@click.argument("name", default="World")
-def hello(name: str) -> None:
+@click.argument("name", required=False)
+@click.option(
+    "--from-file",
+    "-f",
+    "names_file",
+    type=click.File("r"),
+    help="Greet every name in a file, one per line ('-' for stdin)",
+)
+def hello(name: str | None, names_file: TextIO | None) -> None:
     """Say hello to someone."""
-    message = greet(name)
+    if names_file is not None:
+        if name is not None:
+            raise click.UsageError("NAME cannot be combined with --from-file")
+        _stream_greetings(names_file, sys.stdout)
+        return
+
+    message = greet(name or "World")
     console.print(f"[bold green]{message}[/bold green]")
 
 
+def _stream_greetings(names_file: TextIO, out: TextIO) -> None:
+    """Write a plain-text greeting per input line, in buffered chunks."""
+    greetings = greet_many(line.rstrip("\r\n") for line in names_file)
+    while chunk := list(islice(greetings, GREETING_CHUNK_SIZE)):
+        out.write("\n".join(chunk))
+        out.write("\n")
+    out.flush()
+
+
 @cli.command()
 @click.argument("input_file", type=click.Path(exists=True, path_type=Path))
 @click.option(
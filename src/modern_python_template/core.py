@@ -1,6 +1,7 @@
 """Core functionality for the modern Python template."""
 
 import logging
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -44,14 +45,44 @@ def greet(name: str = "World") -> str:
         >>> greet("Alice")
         'Hello, Alice!'
     """
-    if not name or not name.strip():
-        name = "World"
-
-    message = f"Hello, {name.strip()}!"
+    message = _build_greeting(name or "")
     logger.info("Generated greeting: %s", message)
     return message
 
 
+def _build_greeting(name: str) -> str:
+    """Build the greeting for a raw name without logging."""
+    name = name.strip()
+    return f"Hello, {name or 'World'}!"
+
+
+def greet_many(names: Iterable[str]) -> Iterator[str]:
+    """
+    Lazily generate greeting messages for many names.
+
+    Names are normalised exactly like ``greet``, but only a single summary
+    is logged once the input is exhausted. Greetings are not memoised:
+    building one is cheaper than an LRU cache lookup, even when every
+    name repeats.
+
+    Args:
+        names: Iterable of names to greet
+
+    Yields:
+        Greeting message for each name, in input order
+
+    Example:
+        >>> list(greet_many(["Alice", " Bob ", ""]))
+        ['Hello, Alice!', 'Hello, Bob!', 'Hello, World!']
+    """
+    count = 0
+    for name in names:
+        yield _build_greeting(name or "")
+        count += 1
+
+    logger.info("Generated %d greetings", count)
+
+
 def process_data(data: list[dict[str, Any]]) -> list[DataModel]:
     """
     Process a list of data dictionaries into validated DataModel objects.
@@ -31,3 +31,10 @@ def sample_data_models() -> list[DataModel]:
 def empty_data() -> list[Any]:
     """Empty data for testing."""
     return []
+
+
+@pytest.fixture(scope="session")
+def bulk_names() -> list[str]:
+    """One million names, mostly unique, with a tail of popular repeats."""
+    total = 1_000_000
+    return [f"popular{i % 100}" if i % 10 == 0 else f"user{i}" for i in range(total)]
@@ -1,11 +1,16 @@
 """Tests for the CLI module."""
 
+import io
 import json
+import logging
 import tempfile
+import time
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
+from modern_python_template import cli as cli_module
 from modern_python_template.cli import cli
 
 
@@ -26,6 +31,90 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Hello, Alice!" in result.output
 
+    def test_cli_hello_from_file(self) -> None:
+        """Test hello command with names read from a file."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+            f.write("Alice\n  Bob  \n\nAlice\n")
+            temp_path = Path(f.name)
+
+        try:
+            runner = CliRunner()
+            result = runner.invoke(cli, ["hello", "--from-file", str(temp_path)])
+            assert result.exit_code == 0
+            assert result.output.splitlines() == [
+                "Hello, Alice!",
+                "Hello, Bob!",
+                "Hello, World!",
+                "Hello, Alice!",
+            ]
+        finally:
+            temp_path.unlink()
+
+    def test_cli_hello_from_stdin(self) -> None:
+        """Test hello command with names read from stdin."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["hello", "-f", "-"], input="Alice\nBob\n")
+        assert result.exit_code == 0
+        assert result.output.splitlines() == ["Hello, Alice!", "Hello, Bob!"]
+
+    @pytest.mark.parametrize(
+        "names_input",
+        [
+            "a\nb\nc\nd\n",
+            "a\nb\nc\nd\ne\n",
+            "a\nb\nc\nd\ne",
+            "a\r\nb\r\nc",
+        ],
+    )
+    def test_cli_hello_from_file_chunks(self, monkeypatch, names_input) -> None:
+        """Test that every greeting survives the chunk boundaries."""
+        monkeypatch.setattr(cli_module, "GREETING_CHUNK_SIZE", 2)
+        runner = CliRunner()
+        result = runner.invoke(cli, ["hello", "-f", "-"], input=names_input)
+        assert result.exit_code == 0
+        assert result.output == "".join(
+            f"Hello, {name}!\n" for name in names_input.splitlines()
+        )
+
+    @pytest.mark.slow
+    def test_stream_greetings_benchmark(self, bulk_names, record_property) -> None:
+        """Benchmark streaming one million mostly unique names."""
+        names_file = io.StringIO("\n".join(bulk_names) + "\n")
+        out = io.StringIO()
+
+        start = time.perf_counter()
+        cli_module._stream_greetings(names_file, out)
+        elapsed = time.perf_counter() - start
+
+        assert out.getvalue().count("\n") == len(bulk_names)
+        record_property("stream_greetings_seconds", elapsed)
+
+    def test_cli_hello_from_file_logs_to_stderr(self, monkeypatch) -> None:
+        """Test that log records never end up in the greeting stream."""
+        runner = CliRunner()
+        with monkeypatch.context() as m:
+            # Drop pytest's handlers so setup_logging's basicConfig takes effect
+            m.setattr(logging.root, "handlers", [])
+            m.setattr(logging.root, "level", logging.WARNING)
+            result = runner.invoke(cli, ["hello", "-f", "-"], input="Alice\nBob\n")
+            assert logging.root.handlers
+
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == ["Hello, Alice!", "Hello, Bob!"]
+
+    def test_cli_hello_name_with_from_file(self) -> None:
+        """Test that NAME and --from-file are mutually exclusive."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["hello", "Bob", "-f", "-"], input="Alice\n")
+        assert result.exit_code == 2
+        assert "NAME cannot be combined with --from-file" in result.output
+
+    def test_cli_hello_from_nonexistent_file(self) -> None:
+        """Test hello command with non-existent names file."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["hello", "--from-file", "nonexistent.txt"])
+        assert result.exit_code != 0
+
     def test_cli_demo(self) -> None:
         """Test demo command."""
         runner = CliRunner()
@@ -1,12 +1,17 @@
 """Tests for the core module."""
 
+import time
+from functools import lru_cache
+
 import pytest
 from pydantic import ValidationError
 
 from modern_python_template.core import (
     DataModel,
+    _build_greeting,
     calculate_statistics,
     greet,
+    greet_many,
     process_data,
 )
 
@@ -77,12 +82,64 @@ class TestGreet:
         result = greet("   ")
         assert result == "Hello, World!"
 
+    def test_greet_none(self) -> None:
+        """Test greeting with None falls back to the default name."""
+        result = greet(None)  # type: ignore[arg-type]
+        assert result == "Hello, World!"
+
     def test_greet_with_whitespace(self) -> None:
         """Test greeting with name containing whitespace."""
         result = greet("  Alice  ")
         assert result == "Hello, Alice!"
 
 
+class TestGreetMany:
+    """Tests for the greet_many function."""
+
+    def test_greet_many_matches_greet(self) -> None:
+        """Test that bulk greetings match single greetings."""
+        names = ["Alice", "  Bob  ", "", "   ", None, "Alice"]
+        assert list(greet_many(names)) == [greet(name) for name in names]
+
+    def test_greet_many_empty(self) -> None:
+        """Test greeting an empty iterable."""
+        assert list(greet_many([])) == []
+
+    def test_greet_many_is_lazy(self) -> None:
+        """Test that names are consumed on demand."""
+        names = iter(["Alice", "Bob"])
+        greetings = greet_many(names)
+        assert next(greetings) == "Hello, Alice!"
+        assert next(names) == "Bob"
+
+    @pytest.mark.slow
+    def test_greet_many_benchmark(self, bulk_names, record_property) -> None:
+        """Benchmark greeting one million mostly unique names."""
+        start = time.perf_counter()
+        count = sum(1 for _ in greet_many(bulk_names))
+        elapsed = time.perf_counter() - start
+
+        assert count == len(bulk_names)
+        record_property("greet_many_seconds", elapsed)
+
+    @pytest.mark.slow
+    def test_greet_many_cache_comparison(self, bulk_names, record_property) -> None:
+        """Compare greet_many against an LRU-memoised greeting builder."""
+        cached_build = lru_cache(maxsize=4096)(_build_greeting)
+
+        start = time.perf_counter()
+        uncached = list(greet_many(bulk_names))
+        uncached_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cached = [cached_build(name) for name in bulk_names]
+        cached_elapsed = time.perf_counter() - start
+
+        assert cached == uncached
+        record_property("uncached_seconds", uncached_elapsed)
+        record_property("lru_cached_seconds", cached_elapsed)
+
+
 class TestProcessData:
     """Tests for the process_data function."""
 